@@ -2,7 +2,8 @@ import linecache
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from threading import Lock
-from typing import Any, Callable, Dict
+from types import CodeType
+from typing import Any, Callable, Dict, Optional
 
 from .code_builder import CodeBuilder
 
@@ -44,7 +45,47 @@ class ConcurrentCounter:
 _counter = ConcurrentCounter()
 
 
+class ConcurrentCodeCache:
+    """Stores code objects compiled from the source text.
+    Identical models produce identical source, so the compilation can be shared
+    and only execution of the code (binding to the new namespace) is repeated.
+    Shared code keeps the filename of its first compilation,
+    so tracebacks of all closures made from the same source show that filename.
+    At most ``max_size`` sources are kept, the oldest ones are evicted first.
+    """
+    __slots__ = ("_lock", "_source_to_code", "_max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._lock = Lock()
+        self._source_to_code: Dict[str, CodeType] = {}
+        self._max_size = max_size
+
+    def get(self, source: str) -> Optional[CodeType]:
+        with self._lock:
+            return self._source_to_code.get(source)
+
+    def add(self, source: str, code_obj: CodeType) -> CodeType:
+        """Store code object unless another one was stored for this source concurrently.
+        :return: code object associated with the source
+        """
+        with self._lock:
+            code_obj = self._source_to_code.setdefault(source, code_obj)
+            while len(self._source_to_code) > self._max_size:
+                del self._source_to_code[next(iter(self._source_to_code))]
+            return code_obj
+
+
+# 1024 sources cover the models of even large applications (one source per distinct model loader or dumper),
+# while keeping memory bounded for processes that generate models dynamically
+_code_cache = ConcurrentCodeCache(max_size=1024)
+
+
 class BasicClosureCompiler(ClosureCompiler):
+    """Compiles closures sharing code objects of identical sources via a process-wide cache.
+    The cache keeps up to 1024 most recently added sources.
+    Closures made from a cached code object report the filename of its first compilation
+    """
+
     def _make_source_builder(self, builder: CodeBuilder) -> CodeBuilder:
         main_builder = CodeBuilder()
 
@@ -55,16 +96,23 @@ class BasicClosureCompiler(ClosureCompiler):
         return main_builder
 
     def _compile(self, source: str, unique_filename: str, namespace: Dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+        code_obj = _code_cache.get(source)
+        if code_obj is None:
+            code_obj = _code_cache.add(source, compile(source, unique_filename, "exec"))
+
+        # Tracebacks of shared code refer to the filename of the first compilation.
+        # The entry is registered again if linecache was cleared since then
+        filename = code_obj.co_filename
+        if filename not in linecache.cache:
+            linecache.cache[filename] = (
+                len(source),
+                None,
+                source.splitlines(keepends=True),
+                filename,
+            )
 
         local_namespace: Dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
-        linecache.cache[unique_filename] = (
-            len(source),
-            None,
-            source.splitlines(keepends=True),
-            unique_filename,
-        )
         return local_namespace["_closure_maker"]()
 
     def _get_unique_id(self, base_id: str) -> str:
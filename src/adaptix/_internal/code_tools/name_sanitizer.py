@@ -16,6 +16,8 @@ class BuiltinNameSanitizer(NameSanitizer):
     def sanitize(self, name: str) -> str:
         if name == "":
             return ""
+        if name.isascii() and name.isidentifier():  # such names are kept intact anyway
+            return name
 
         first_letter = name[0] if name[0] in string.ascii_letters else "_"
         return first_letter + self._BAD_CHARS.sub("", name[1:].translate(self._TRANSLATE_MAP))
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Callable, FrozenSet, Generic, Hashable, Mapping, Optional, TypeVar, Union
 
 from ..common import Catchable, TypeHint, VarTuple
@@ -149,6 +150,9 @@ def is_valid_field_id(value: str) -> bool:
     return value.isidentifier()
 
 
+EMPTY_METADATA: Mapping[Any, Any] = MappingProxyType({})
+
+
 @dataclass(frozen=True)
 class BaseField:
     id: str
@@ -1,13 +1,13 @@
 import inspect
 import typing
 from inspect import Parameter, Signature
-from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
 from ...common import VarTuple
 from ...feature_requirement import HAS_PY_312
 from ...type_tools import get_all_type_hints, normalize_type
 from ..definitions import (
+    EMPTY_METADATA,
     DefaultValue,
     InputField,
     InputShape,
@@ -89,7 +89,7 @@ def get_callable_shape(func, params_slice=slice(0, None)) -> Shape[InputShape, N
                     id=param.name,
                     is_required=_is_empty(param.default) or param.kind == Parameter.POSITIONAL_ONLY,
                     default=NoDefault() if _is_empty(param.default) else DefaultValue(param.default),
-                    metadata=MappingProxyType({}),
+                    metadata=EMPTY_METADATA,
                     original=param,
                 )
                 for param in params
@@ -1,8 +1,8 @@
-from types import MappingProxyType
 from typing import Any
 
 from ...type_tools import get_all_type_hints, is_named_tuple_class
 from ..definitions import (
+    EMPTY_METADATA,
     DefaultValue,
     FullShape,
     InputField,
@@ -23,12 +23,15 @@ def get_named_tuple_shape(tp) -> FullShape:
         raise IntrospectionError
 
     type_hints = get_all_type_hints(tp)
+    # noinspection PyProtectedMember
+    field_ids = tp._fields
+    # noinspection PyProtectedMember
+    field_defaults = tp._field_defaults
     if tuple in tp.__bases__:
-        overriden_types = frozenset(tp._fields)
+        overriden_types = frozenset(field_ids)
     else:
-        overriden_types = frozenset(tp.__annotations__.keys() & set(tp._fields))
+        overriden_types = frozenset(tp.__annotations__.keys() & set(field_ids))
 
-    # noinspection PyProtectedMember
     input_shape = InputShape(
         constructor=tp,
         kwargs=None,
@@ -37,15 +40,15 @@ def get_named_tuple_shape(tp) -> FullShape:
                 id=field_id,
                 type=type_hints.get(field_id, Any),
                 default=(
-                    DefaultValue(tp._field_defaults[field_id])
-                    if field_id in tp._field_defaults else
+                    DefaultValue(field_defaults[field_id])
+                    if field_id in field_defaults else
                     NoDefault()
                 ),
-                is_required=field_id not in tp._field_defaults,
-                metadata=MappingProxyType({}),
+                is_required=field_id not in field_defaults,
+                metadata=EMPTY_METADATA,
                 original=None,
             )
-            for field_id in tp._fields
+            for field_id in field_ids
         ),
         params=tuple(
             Param(
@@ -53,7 +56,7 @@ def get_named_tuple_shape(tp) -> FullShape:
                 name=field_id,
                 kind=ParamKind.POS_OR_KW,
             )
-            for field_id in tp._fields
+            for field_id in field_ids
         ),
         overriden_types=overriden_types,
     )
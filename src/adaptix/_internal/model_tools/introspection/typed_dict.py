@@ -1,11 +1,11 @@
 import typing
 import warnings
-from types import MappingProxyType
 from typing import AbstractSet, Sequence, Set, Tuple
 
 from ...feature_requirement import HAS_PY_39, HAS_TYPED_DICT_REQUIRED
 from ...type_tools import BaseNormType, get_all_type_hints, is_typed_dict_class, normalize_type
 from ..definitions import (
+    EMPTY_METADATA,
     FullShape,
     InputField,
     InputShape,
@@ -103,7 +103,7 @@ def get_typed_dict_shape(tp) -> FullShape:
                     id=name,
                     default=NoDefault(),
                     is_required=requirement_determinant(name),
-                    metadata=MappingProxyType({}),
+                    metadata=EMPTY_METADATA,
                     original=None,
                 )
                 for name, tp in type_hints
@@ -129,7 +129,7 @@ def get_typed_dict_shape(tp) -> FullShape:
                         key=name,
                         access_error=None if requirement_determinant(name) else KeyError,
                     ),
-                    metadata=MappingProxyType({}),
+                    metadata=EMPTY_METADATA,
                     original=None,
                 )
                 for name, tp in type_hints
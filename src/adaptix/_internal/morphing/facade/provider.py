@@ -281,7 +281,7 @@ def with_property(
         pred,
         PropertyExtender(
             output_fields=[field],
-            infer_types_for=[field.id] if tp == Omitted() else [],
+            infer_types_for=[field.id] if isinstance(tp, Omitted) else [],
         ),
     )
 
@@ -18,7 +18,7 @@ from ...model_tools.definitions import (
     OutputShape,
 )
 from ...special_cases_optimization import as_is_stub, get_default_clause
-from ...struct_trail import append_trail, extend_trail, render_trail_as_note
+from ...struct_trail import append_trail, render_trail_as_note
 from .basic_gen import ModelDumperGen, get_skipped_fields
 from .crown_definitions import (
     CrownPath,
@@ -111,6 +111,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             if isinstance(self._name_layout.extra_move, ExtraTargets)
             else ()
         )
+        self._extra_target_ids = frozenset(self._extra_targets)
         self._id_to_field: Dict[str, OutputField] = {field.id: field for field in self._shape.fields}
         self._model_identity = model_identity
 
@@ -118,9 +119,8 @@ class BuiltinModelDumperGen(ModelDumperGen):
         body_builder = CodeBuilder()
 
         namespace = BuiltinCascadeNamespace()
-        namespace.add_constant("CompatExceptionGroup", CompatExceptionGroup)
-        namespace.add_constant("append_trail", append_trail)
-        namespace.add_constant("extend_trail", extend_trail)
+        if self._debug_trail in (DebugTrail.FIRST, DebugTrail.ALL):
+            namespace.add_constant("append_trail", append_trail)
         for field_id, dumper in self._fields_dumpers.items():
             namespace.add_constant(self._v_dumper(self._id_to_field[field_id]), dumper)
 
@@ -166,7 +166,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         return builder.string(), namespace.all_constants
 
     def _is_extra_target(self, field: OutputField) -> bool:
-        return field.id in self._extra_targets
+        return field.id in self._extra_target_ids
 
     def _v_field(self, field: OutputField) -> str:
         return f"f_{field.id}"
@@ -218,7 +218,6 @@ class BuiltinModelDumperGen(ModelDumperGen):
         on_access_ok: str,
     ):
         raw_access_expr = self._gen_access_expr(namespace, field)
-        v_element_expr = self._get_trail_element_expr(namespace, field)
 
         if self._fields_dumpers[field.id] == as_is_stub:
             on_access_ok_stmt = Template(on_access_ok).substitute(expr=raw_access_expr)
@@ -227,6 +226,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             on_access_ok_stmt = Template(on_access_ok).substitute(expr=f"{dumper}({raw_access_expr})")
 
         if self._debug_trail == DebugTrail.ALL:
+            v_element_expr = self._get_trail_element_expr(namespace, field)
             builder += f"""
                 try:
                     {on_access_ok_stmt}
@@ -234,6 +234,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
                     errors.append(append_trail(e, {v_element_expr}))
             """
         elif self._debug_trail == DebugTrail.FIRST:
+            v_element_expr = self._get_trail_element_expr(namespace, field)
             builder += f"""
                 try:
                     {on_access_ok_stmt}
@@ -256,7 +257,6 @@ class BuiltinModelDumperGen(ModelDumperGen):
         on_access_ok: str,
     ):
         raw_access_expr = self._gen_access_expr(namespace, field)
-        path_element_expr = self._get_trail_element_expr(namespace, field)
 
         v_raw_field = self._v_raw_field(field)
         if self._fields_dumpers[field.id] == as_is_stub:
@@ -276,6 +276,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             namespace.add_constant(access_error_expr, access_error)
 
         if self._debug_trail == DebugTrail.ALL:
+            path_element_expr = self._get_trail_element_expr(namespace, field)
             builder += f"""
                 try:
                     {v_raw_field} = {raw_access_expr}
@@ -288,6 +289,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
                         errors.append(append_trail(e, {path_element_expr}))
             """
         elif self._debug_trail == DebugTrail.FIRST:
+            path_element_expr = self._get_trail_element_expr(namespace, field)
             builder += f"""
                 try:
                     {v_raw_field} = {raw_access_expr}
@@ -340,6 +342,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
 
         namespace.add_constant("model_identity", self._model_identity)
         namespace.add_constant("render_trail_as_note", render_trail_as_note)
+        namespace.add_constant("CompatExceptionGroup", CompatExceptionGroup)
         builder(
             """
             if errors:
@@ -380,7 +383,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             )
             self._gen_raising_extraction_errors(builder, namespace)
 
-        elif all(field.is_required for field in self._id_to_field.values()):
+        elif all(self._id_to_field[field_id].is_required for field_id in self._extra_targets):
             for field_id in self._extra_targets:
                 field = self._id_to_field[field_id]
 
@@ -390,12 +393,11 @@ class BuiltinModelDumperGen(ModelDumperGen):
                 )
 
             self._gen_raising_extraction_errors(builder, namespace)
-            builder += "extra = {"
-            builder <<= ", ".join(
+            extra_unpacking = ", ".join(
                 "**" + self._v_field(self._id_to_field[field_id])
                 for field_id in self._extra_targets
             )
-            builder <<= "}"
+            builder += f"extra = {{{extra_unpacking}}}"
         else:
             builder += "extra_stack = []"
             for field_id in self._extra_targets:
@@ -410,9 +412,9 @@ class BuiltinModelDumperGen(ModelDumperGen):
 
             self._gen_raising_extraction_errors(builder, namespace)
             builder += """
-                extra = {
-                    key: value for extra_element in extra_stack for key, value in extra_element.items()
-                }
+                extra = {}
+                for extra_element in extra_stack:
+                    extra.update(extra_element)
             """
 
     def _gen_extra_extract_extraction(
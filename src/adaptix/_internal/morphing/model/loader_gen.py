@@ -1,7 +1,7 @@
 import collections.abc
 import contextlib
 from dataclasses import dataclass
-from typing import AbstractSet, Dict, List, Mapping, Optional, Set, Tuple
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
@@ -41,7 +41,15 @@ from .crown_definitions import (
 )
 
 
+def get_items_count_error(expected_len: int, data: Sequence[Any]) -> LoadError:
+    if len(data) < expected_len:
+        return NoRequiredItemsLoadError(expected_len, data)
+    return ExtraItemsLoadError(expected_len, data)
+
+
 class Namer:
+    __slots__ = ("debug_trail", "path_to_suffix", "_path", "_path_suffix")
+
     def __init__(
         self,
         debug_trail: DebugTrail,
@@ -51,11 +59,10 @@ class Namer:
         self.debug_trail = debug_trail
         self.path_to_suffix = path_to_suffix
         self._path = path
+        self._path_suffix = "_" + path_to_suffix[path] if path else ""
 
     def _with_path_suffix(self, basis: str) -> str:
-        if not self._path:
-            return basis
-        return basis + "_" + self.path_to_suffix[self._path]
+        return basis + self._path_suffix
 
     @property
     def path(self) -> CrownPath:
@@ -97,6 +104,11 @@ class Namer:
 
 
 class GenState(Namer):
+    __slots__ = (
+        "builder", "namespace", "_name_to_field", "field_id_to_path", "_last_path_idx",
+        "_parent_path", "_parent", "_crown_stack", "type_checked_type_paths",
+    )
+
     path_to_suffix: Dict[CrownPath, str]
 
     def __init__(
@@ -115,6 +127,7 @@ class GenState(Namer):
 
         self._last_path_idx = 0
         self._parent_path: Optional[CrownPath] = None
+        self._parent: Optional[Namer] = None
         self._crown_stack: List[InpCrown] = [root_crown]
 
         self.type_checked_type_paths: Set[CrownPath] = set()
@@ -122,7 +135,9 @@ class GenState(Namer):
 
     @property
     def parent(self) -> Namer:
-        return Namer(self.debug_trail, self.path_to_suffix, self.parent_path)
+        if self._parent is None:
+            raise ValueError
+        return self._parent
 
     def v_field_loader(self, field_id: str) -> str:
         return f"loader_{field_id}"
@@ -146,17 +161,24 @@ class GenState(Namer):
     @contextlib.contextmanager
     def add_key(self, crown: InpCrown, key: CrownPathElem):
         past = self._path
-        past_parent = self._parent_path
+        past_path_suffix = self._path_suffix
+        past_parent_path = self._parent_path
+        past_parent = self._parent
 
         self._parent_path = self._path
+        # parent namer is created once per key instead of every access to the parent's variables
+        self._parent = Namer(self.debug_trail, self.path_to_suffix, self._path)
         self._path += (key,)
         self._crown_stack.append(crown)
         self._last_path_idx += 1
         self.path_to_suffix[self._path] = str(self._last_path_idx)
+        self._path_suffix = "_" + str(self._last_path_idx)
         yield
         self._crown_stack.pop(-1)
         self._path = past
-        self._parent_path = past_parent
+        self._path_suffix = past_path_suffix
+        self._parent_path = past_parent_path
+        self._parent = past_parent
 
     def get_field(self, crown: InpFieldCrown) -> InputField:
         self.field_id_to_path[crown.id] = self._path
@@ -196,20 +218,28 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             param.field_id: param for param in self._shape.params
         }
         self._field_loaders = field_loaders
+        self._as_is_field_ids: AbstractSet[str] = frozenset(
+            field_id for field_id, loader in field_loaders.items() if loader is as_is_stub
+        )
         self._skipped_fields = skipped_fields
         self._model_identity = model_identity
         self._props = props
+        self._extra_target_ids: AbstractSet[str] = (
+            frozenset(self._name_layout.extra_move.fields)
+            if isinstance(self._name_layout.extra_move, ExtraTargets) else
+            frozenset()
+        )
+        self._packed_field_ids: AbstractSet[str] = frozenset(
+            fld.id for fld in self._shape.fields if self._check_is_packed_field(fld)
+        )
+        self._has_packed_fields = bool(self._packed_field_ids)
 
     @property
     def _can_collect_extra(self) -> bool:
         return self._name_layout.extra_move is not None
 
     def _is_extra_target(self, field: InputField) -> bool:
-        return (
-            isinstance(self._name_layout.extra_move, ExtraTargets)
-            and
-            field.id in self._name_layout.extra_move.fields
-        )
+        return field.id in self._extra_target_ids
 
     def _create_state(self, namespace: CascadeNamespace) -> GenState:
         return GenState(
@@ -220,32 +250,34 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             root_crown=self._name_layout.crown,
         )
 
-    @property
-    def _has_packed_fields(self):
-        return any(self._is_packed_field(fld) for fld in self._shape.fields)
-
-    def _is_packed_field(self, field: InputField) -> bool:
+    def _check_is_packed_field(self, field: InputField) -> bool:
         if self._props.use_default_for_omitted and isinstance(field.default, (DefaultValue, DefaultFactory)):
             return False
         return field.is_optional and not self._is_extra_target(field)
 
+    def _is_packed_field(self, field: InputField) -> bool:
+        return field.id in self._packed_field_ids
+
     def produce_code(self, closure_name: str) -> Tuple[str, Mapping[str, object]]:
         namespace = BuiltinCascadeNamespace()
         state = self._create_state(namespace)
 
         for field_id, loader in self._field_loaders.items():
-            state.namespace.add_constant(state.v_field_loader(field_id), loader)
+            if field_id not in self._as_is_field_ids:
+                state.namespace.add_constant(state.v_field_loader(field_id), loader)
 
         for named_value in (
-            append_trail, extend_trail, render_trail_as_note,
             ExtraFieldsLoadError, ExtraItemsLoadError,
             NoRequiredFieldsLoadError, NoRequiredItemsLoadError,
             TypeLoadError, ExcludedTypeLoadError,
-            LoadError, AggregateLoadError,
         ):
             state.namespace.add_constant(named_value.__name__, named_value)  # type: ignore[attr-defined]
 
-        state.namespace.add_constant("CompatExceptionGroup", CompatExceptionGroup)
+        # helpers are registered only for debug trail modes that may reference them
+        if self._debug_trail in (DebugTrail.FIRST, DebugTrail.ALL):
+            state.namespace.add_constant("append_trail", append_trail)
+            state.namespace.add_constant("extend_trail", extend_trail)
+
         state.namespace.add_constant("CollectionsMapping", collections.abc.Mapping)
         state.namespace.add_constant("CollectionsSequence", collections.abc.Sequence)
         state.namespace.add_constant("sentinel", object())
@@ -254,6 +286,9 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             state.builder += "errors = []"
             state.builder += "has_unexpected_error = False"
             state.namespace.add_constant("model_identity", self._model_identity)
+            state.namespace.add_constant("render_trail_as_note", render_trail_as_note)
+            state.namespace.add_constant("AggregateLoadError", AggregateLoadError)
+            state.namespace.add_constant("CompatExceptionGroup", CompatExceptionGroup)
 
         if self._has_packed_fields:
             state.builder += "packed_fields = {}"
@@ -403,45 +438,48 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         assign_to: str,
         on_lookup_error: Optional[str] = None,
     ):
+        parent = state.parent
+        v_parent_data = parent.v_data
         last_path_el = state.path[-1]
         if isinstance(last_path_el, str):
             lookup_error = "KeyError"
             bad_type_error = "(TypeError, IndexError)"
-            bad_type_load_error = f"TypeLoadError(CollectionsMapping, {state.parent.v_data})"
+            bad_type_load_error = f"TypeLoadError(CollectionsMapping, {v_parent_data})"
             not_found_error = (
                 "NoRequiredFieldsLoadError("
-                f"{state.parent.v_required_keys} - set({state.parent.v_data}), {state.parent.v_data}"
+                f"{parent.v_required_keys} - set({v_parent_data}), {v_parent_data}"
                 ")"
             )
         else:
             lookup_error = "IndexError"
             bad_type_error = "(TypeError, KeyError)"
-            bad_type_load_error = f"TypeLoadError(CollectionsSequence, {state.parent.v_data})"
-            not_found_error = f"NoRequiredItemsLoadError({len(state.parent_crown.map)}, {state.parent.v_data})"
+            bad_type_load_error = f"TypeLoadError(CollectionsSequence, {v_parent_data})"
+            not_found_error = f"NoRequiredItemsLoadError({len(state.parent_crown.map)}, {v_parent_data})"
 
         with state.builder(
             f"""
                 try:
-                    {assign_to} = {state.parent.v_data}[{last_path_el!r}]
+                    {assign_to} = {v_parent_data}[{last_path_el!r}]
                 except {lookup_error}:
             """,
         ):
             if on_lookup_error is not None:
                 state.builder += on_lookup_error
             elif self._debug_trail != DebugTrail.ALL:
-                state.builder += f"raise {state.parent.with_trail(not_found_error)}"
-            elif isinstance(state.path[-1], str):
+                state.builder += f"raise {parent.with_trail(not_found_error)}"
+            elif isinstance(last_path_el, str):
+                v_has_not_found_error = parent.v_has_not_found_error
                 state.builder += f"""
-                    if not {state.parent.v_has_not_found_error}:
-                        errors.append({state.parent.with_trail(not_found_error)})
-                        {state.parent.v_has_not_found_error} = True
+                    if not {v_has_not_found_error}:
+                        errors.append({parent.with_trail(not_found_error)})
+                        {v_has_not_found_error} = True
                 """
             else:
                 state.builder += "pass"
 
         if state.parent_path not in state.type_checked_type_paths:
             with state.builder(f"except {bad_type_error}:"):
-                self._gen_raise_bad_type_error(state, bad_type_load_error, namer=state.parent)
+                self._gen_raise_bad_type_error(state, bad_type_load_error, namer=parent)
             state.type_checked_type_paths.add(state.parent_path)
 
         self._gen_unexpected_exc_catching(state)
@@ -494,11 +532,14 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         }
 
     def _gen_dict_crown(self, state: GenState, crown: InpDictCrown):
-        state.namespace.add_constant(state.v_known_keys, set(crown.map.keys()))
-        state.namespace.add_constant(state.v_required_keys, self._get_dict_crown_required_keys(crown))
+        v_data = state.v_data
+        required_keys = self._get_dict_crown_required_keys(crown)
+        if crown.extra_policy in (ExtraForbid(), ExtraCollect()):
+            state.namespace.add_constant(state.v_known_keys, frozenset(crown.map))
+        state.namespace.add_constant(state.v_required_keys, required_keys)
 
         if state.path:
-            self._gen_assignment_from_parent_data(state, assign_to=state.v_data)
+            self._gen_assignment_from_parent_data(state, assign_to=v_data)
             state.builder.empty_line()
 
         if self._can_collect_extra:
@@ -511,35 +552,55 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 self._gen_crown_dispatch(state, value, key)
 
             if state.path not in state.type_checked_type_paths:
-                with state.builder(f"if not isinstance({state.v_data}, CollectionsMapping):"):
-                    self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsMapping, {state.v_data})")
+                with state.builder(f"if not isinstance({v_data}, CollectionsMapping):"):
+                    self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsMapping, {v_data})")
                 state.builder.empty_line()
                 state.type_checked_type_paths.add(state.path)
 
-            if crown.extra_policy == ExtraForbid():
-                state.builder += f"""
-                    {state.v_extra}_set = set({state.v_data}) - {state.v_known_keys}
-                    if {state.v_extra}_set:
-                        {state.emit_error(f"ExtraFieldsLoadError({state.v_extra}_set, {state.v_data})")}
-                """
-                state.builder.empty_line()
-            elif crown.extra_policy == ExtraCollect():
-                state.builder += f"""
-                    for key in set({state.v_data}) - {state.v_known_keys}:
-                        {state.v_extra}[key] = {state.v_data}[key]
-                """
-                state.builder.empty_line()
+            self._gen_extra_keys_processing(state, crown, required_keys)
 
         if self._can_collect_extra:
             self._gen_add_self_extra_to_parent_extra(state)
 
+    def _gen_extra_keys_processing(self, state: GenState, crown: InpDictCrown, required_keys: Set[str]) -> None:
+        v_data = state.v_data
+        v_extra = state.v_extra
+        if crown.extra_policy == ExtraForbid():
+            processing = f"""
+                {v_extra}_set = {v_data}.keys() - {state.v_known_keys}
+                if {v_extra}_set:
+                    {state.emit_error(f"ExtraFieldsLoadError({v_extra}_set, {v_data})")}
+            """
+        elif crown.extra_policy == ExtraCollect():
+            processing = f"""
+                for key in {v_data}.keys() - {state.v_known_keys}:
+                    {v_extra}[key] = {v_data}[key]
+            """
+        else:
+            return
+
+        # If all keys are looked up as required and every missing key has already raised an error,
+        # after successful lookups the mapping contains extra keys only if its length differs.
+        # None crowns are counted as required keys, but no lookup is generated for them
+        if (
+            self._debug_trail == DebugTrail.ALL
+            or len(required_keys) != len(crown.map)
+            or any(isinstance(sub_crown, InpNoneCrown) for sub_crown in crown.map.values())
+        ):
+            state.builder += processing
+        else:
+            with state.builder(f"if len({v_data}) != {len(crown.map)}:"):
+                state.builder += processing
+        state.builder.empty_line()
+
     def _gen_forbidden_sequence_check(self, state: GenState) -> None:
         with state.builder(f"if type({state.v_data}) is str:"):
             self._gen_raise_bad_type_error(state, f"ExcludedTypeLoadError(CollectionsSequence, str, {state.v_data})")
 
     def _gen_list_crown(self, state: GenState, crown: InpListCrown):
+        v_data = state.v_data
         if state.path:
-            self._gen_assignment_from_parent_data(state, assign_to=state.v_data)
+            self._gen_assignment_from_parent_data(state, assign_to=v_data)
             state.builder.empty_line()
 
         if self._can_collect_extra:
@@ -557,24 +618,23 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 self._gen_crown_dispatch(state, value, key)
 
             if state.path not in state.type_checked_type_paths:
-                with state.builder(f"if not isinstance({state.v_data}, CollectionsSequence):"):
-                    self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsSequence, {state.v_data})")
+                with state.builder(f"if not isinstance({v_data}, CollectionsSequence):"):
+                    self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsSequence, {v_data})")
                 state.builder.empty_line()
                 state.type_checked_type_paths.add(state.path)
 
             expected_len = len(crown.map)
             if crown.extra_policy == ExtraForbid():
+                # the helper is registered only for loaders that reference it
+                state.namespace.add_constant("get_items_count_error", get_items_count_error)
                 state.builder += f"""
-                    if len({state.v_data}) != {expected_len}:
-                        if len({state.v_data}) < {expected_len}:
-                            {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
-                        else:
-                            {state.emit_error(f"ExtraItemsLoadError({expected_len}, {state.v_data})")}
+                    if len({v_data}) != {expected_len}:
+                        {state.emit_error(f"get_items_count_error({expected_len}, {v_data})")}
                 """
             else:
                 state.builder += f"""
-                    if len({state.v_data}) < {expected_len}:
-                        {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
+                    if len({v_data}) < {expected_len}:
+                        {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {v_data})")}
                 """
 
         if self._can_collect_extra:
@@ -726,7 +786,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         loader_arg: str,
         state: GenState,
     ):
-        if self._field_loaders[field_id] == as_is_stub:
+        if field_id in self._as_is_field_ids:
             processing_expr = loader_arg
         else:
             field_loader = state.v_field_loader(field_id)
@@ -177,7 +177,7 @@ class ModelLoaderProvider(LoaderProvider):
             )
 
         optional_fields_at_list_crown = get_optional_fields_at_list_crown(
-            {field.id: field for field in shape.fields},
+            shape.fields_dict,
             name_layout.crown,
         )
         if optional_fields_at_list_crown:
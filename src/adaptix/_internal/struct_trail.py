@@ -34,17 +34,18 @@ Trail = Sequence[TrailElement]
 
 T = TypeVar("T")
 
+_TRAIL_ATTR = "_adaptix_struct_trail"
+
 
 def append_trail(obj: T, trail_element: TrailElement) -> T:
     """Append a trail element to object. Trail stores in special attribute,
     if an object does not allow adding 3rd-party attributes, do nothing.
     Element inserting to start of the path (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque([trail_element])  # type: ignore[attr-defined]
+    # getattr with default is cheaper than catching AttributeError that is raised for each fresh exception
+    trail = getattr(obj, _TRAIL_ATTR, None)
+    if trail is None:
+        setattr(obj, _TRAIL_ATTR, deque([trail_element]))
     else:
         trail.appendleft(trail_element)
     return obj
@@ -55,11 +56,9 @@ def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
     if an object does not allow adding 3rd-party attributes, do nothing.
     Sub path inserting to start (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque(sub_trail)  # type: ignore[attr-defined]
+    trail = getattr(obj, _TRAIL_ATTR, None)
+    if trail is None:
+        setattr(obj, _TRAIL_ATTR, deque(sub_trail))
     else:
         trail.extendleft(reversed(sub_trail))
     return obj
@@ -67,11 +66,10 @@ def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
 
 def get_trail(obj: object) -> Trail:
     """Retrieve trail from an object. Trail stores in special private attribute that never be accessed directly"""
-    try:
-        # noinspection PyProtectedMember
-        return obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
+    trail = getattr(obj, _TRAIL_ATTR, None)
+    if trail is None:
         return deque()
+    return trail
 
 
 BaseExcT = TypeVar("BaseExcT", bound=BaseException)
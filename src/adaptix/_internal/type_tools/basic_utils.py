@@ -10,6 +10,8 @@ from .fundamentals import get_generic_args, get_type_vars, strip_alias
 
 def is_subclass_soft(cls, classinfo) -> bool:
     """Acts like builtin issubclass, but returns False instead of rising TypeError"""
+    if not isinstance(cls, type):  # avoid costly exception raising for the most common failure case
+        return False
     try:
         return issubclass(cls, classinfo)
     except TypeError:
@@ -77,10 +79,13 @@ else:
 
 def is_generic(tp: TypeHint) -> bool:
     """Check if the type could be parameterized"""
+    if get_type_vars(tp):
+        return True
+
+    origin = strip_alias(tp)
     return (
-        bool(get_type_vars(tp))
-        or (
-            strip_alias(tp) in BUILTIN_ORIGIN_TO_TYPEVARS
+        (
+            origin in BUILTIN_ORIGIN_TO_TYPEVARS
             and tp != type
             and not is_parametrized(tp)
             and (
@@ -89,7 +94,7 @@ def is_generic(tp: TypeHint) -> bool:
         )
         or (
             bool(HAS_ANNOTATED)
-            and strip_alias(tp) == typing.Annotated
+            and origin == typing.Annotated
             and tp != typing.Annotated
             and is_generic(tp.__origin__)
         )
@@ -138,8 +143,10 @@ def get_type_vars_of_parametrized(tp: TypeHint) -> VarTuple[TypeVar]:
 
 
 if HAS_PY_39:
+    _EMPTY_RECURSIVE_GUARD: frozenset = frozenset()
+
     def eval_forward_ref(namespace: Dict[str, Any], forward_ref: ForwardRef):
-        return forward_ref._evaluate(namespace, None, frozenset())
+        return forward_ref._evaluate(namespace, None, _EMPTY_RECURSIVE_GUARD)
 else:
     def eval_forward_ref(namespace: Dict[str, Any], forward_ref: ForwardRef):
         return forward_ref._evaluate(namespace, None)  # type: ignore[call-arg]
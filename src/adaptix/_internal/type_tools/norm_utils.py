@@ -18,8 +18,8 @@ def strip_tags(norm: BaseNormType) -> BaseNormType:
     """Removes type hints that do not represent a type
     and that only indicates metadata
     """
-    if norm.origin in _TYPE_TAGS:
-        return strip_tags(norm.args[0])
+    while norm.origin in _TYPE_TAGS:
+        norm = norm.args[0]
     return norm
 
 
@@ -0,0 +1,79 @@
+import linecache
+
+import pytest
+
+from adaptix._internal.code_tools import compiler
+from adaptix._internal.code_tools.code_builder import CodeBuilder
+from adaptix._internal.code_tools.compiler import BasicClosureCompiler, ConcurrentCodeCache
+
+
+@pytest.fixture(autouse=True)
+def code_cache(monkeypatch):
+    code_cache = ConcurrentCodeCache(max_size=16)
+    monkeypatch.setattr(compiler, "_code_cache", code_cache)
+    return code_cache
+
+
+def _compile_getter(value, filenames=None):
+    def filename_maker(uid):
+        filename = f"<test {uid}>"
+        if filenames is not None:
+            filenames.append(filename)
+        return filename
+
+    builder = CodeBuilder()
+    builder += """
+        def getter():
+            return value
+        return getter
+    """
+    return BasicClosureCompiler().compile(
+        "test_compiler_getter",
+        filename_maker,
+        builder,
+        {"value": value},
+    )
+
+
+def test_code_sharing():
+    first = _compile_getter(1)
+    second = _compile_getter(2)
+
+    assert first() == 1
+    assert second() == 2
+    assert first is not second
+    assert first.__code__ is second.__code__
+
+
+def test_shared_code_filename():
+    filenames = []
+    first = _compile_getter(1, filenames)
+    second = _compile_getter(2, filenames)
+
+    assert len(filenames) == 2
+    assert filenames[0] != filenames[1]
+    assert first.__code__.co_filename == filenames[0]
+    assert second.__code__.co_filename == filenames[0]
+    assert filenames[0] in linecache.cache
+    assert filenames[1] not in linecache.cache
+
+
+def test_linecache_reregistration():
+    filenames = []
+    _compile_getter(1, filenames)
+    linecache.clearcache()
+    _compile_getter(2, filenames)
+
+    assert linecache.getline(filenames[0], 2).strip() == "def getter():"
+
+
+def test_code_cache_eviction():
+    code_cache = ConcurrentCodeCache(max_size=2)
+    codes = [compile(f"x = {i}", f"<test code_cache {i}>", "exec") for i in range(3)]
+    for i, code in enumerate(codes):
+        assert code_cache.add(f"x = {i}", code) is code
+
+    assert code_cache.get("x = 0") is None
+    assert code_cache.get("x = 1") is codes[1]
+    assert code_cache.get("x = 2") is codes[2]
+    assert code_cache.add("x = 2", compile("x = 2", "<other>", "exec")) is codes[2]
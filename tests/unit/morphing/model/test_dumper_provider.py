@@ -698,6 +698,66 @@ def test_several_extra_target(
     )
 
 
+def test_required_extra_targets_with_optional_field(debug_ctx, debug_trail, trail_select, acc_schema):
+    dumper_getter = make_dumper_getter(
+        shape=shape(
+            TestField("a", acc_schema.accessor_maker("a", is_required=False)),
+            TestField("b", acc_schema.accessor_maker("b", is_required=True)),
+            TestField("c", acc_schema.accessor_maker("c", is_required=True)),
+        ),
+        name_layout=OutputNameLayout(
+            crown=OutDictCrown(
+                {
+                    "a": OutFieldCrown("a"),
+                },
+                sieves={},
+            ),
+            extra_move=ExtraTargets(("b", "c")),
+        ),
+        debug_trail=debug_trail,
+        debug_ctx=debug_ctx,
+    )
+    dumper = dumper_getter()
+    # required extra targets are merged directly, regardless of optional non-target fields
+    assert "extra_stack" not in debug_ctx.source
+
+    assert dumper(acc_schema.dummy(a=1, b={"b1": 2}, c={"c1": 3})) == {"a": 1, "b1": 2, "c1": 3}
+    assert dumper(acc_schema.dummy(a=1, b={"d": 2}, c={"d": 3})) == {"a": 1, "d": 3}
+    assert dumper(acc_schema.dummy(b={"b1": 2}, c={})) == {"b1": 2}
+
+    raises_exc(
+        trail_select(
+            disable=acc_schema.access_error(ANY),
+            first=with_trail(
+                acc_schema.access_error(ANY),
+                [acc_schema.trail_element_maker("c")],
+            ),
+            all=CompatExceptionGroup(
+                f"while dumping model {Dummy}",
+                [
+                    with_trail(
+                        acc_schema.access_error(ANY),
+                        [acc_schema.trail_element_maker("c")],
+                    ),
+                ],
+            ),
+        ),
+        lambda: dumper(acc_schema.dummy(a=1, b={"b1": 2})),
+    )
+
+    raises_exc(
+        trail_select(
+            disable=SomeError(),
+            first=with_trail(SomeError(), [acc_schema.trail_element_maker("b")]),
+            all=CompatExceptionGroup(
+                f"while dumping model {Dummy}",
+                [with_trail(SomeError(), [acc_schema.trail_element_maker("b")])],
+            ),
+        ),
+        lambda: dumper(acc_schema.dummy(a=1, b=SomeError(), c={"c1": 3})),
+    )
+
+
 def my_extractor(obj):
     try:
         return int_dumper(obj.b)
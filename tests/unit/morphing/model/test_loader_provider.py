@@ -206,6 +206,19 @@ def test_direct(debug_ctx, debug_trail, extra_policy, trail_select):
         lambda: loader({"a": 1}),
     )
 
+    data = {"a": LoadError()}
+    raises_exc(
+        trail_select(
+            disable=LoadError(),
+            first=with_trail(LoadError(), ["a"]),
+            all=AggregateLoadError(
+                f"while loading model {Gauge}",
+                [with_trail(LoadError(), ["a"]), NoRequiredFieldsLoadError({"b"}, data)],
+            ),
+        ),
+        lambda: loader(data),
+    )
+
     raises_exc(
         trail_select(
             disable=TypeLoadError(CollectionsMapping, "bad input value"),
@@ -344,6 +357,19 @@ def test_direct_list(debug_ctx, debug_trail, extra_policy, trail_select, strict_
         lambda: loader(data),
     )
 
+    data = [LoadError()]
+    raises_exc(
+        trail_select(
+            disable=LoadError(),
+            first=with_trail(LoadError(), [0]),
+            all=AggregateLoadError(
+                f"while loading model {Gauge}",
+                [with_trail(LoadError(), [0]), NoRequiredItemsLoadError(2, data)],
+            ),
+        ),
+        lambda: loader(data),
+    )
+
     if strict_coercion:
         raises_exc(
             trail_select(
@@ -474,6 +500,45 @@ def test_extra_kwargs(debug_ctx, debug_trail):
     assert loader({"a": 1, "b": 2}) == gauge(1, b=2)
 
 
+def test_extra_kwargs_at_required_crown(debug_ctx, debug_trail, trail_select):
+    loader_getter = make_loader_getter(
+        shape=shape(
+            TestField("a", ParamKind.POS_ONLY, is_required=True),
+            TestField("b", ParamKind.POS_ONLY, is_required=True),
+            kwargs=ParamKwargs(Any),
+        ),
+        name_layout=InputNameLayout(
+            crown=InpDictCrown(
+                {
+                    "a": InpFieldCrown("a"),
+                    "b": InpFieldCrown("b"),
+                },
+                extra_policy=ExtraCollect(),
+            ),
+            extra_move=ExtraKwargs(),
+        ),
+        debug_trail=debug_trail,
+        debug_ctx=debug_ctx,
+    )
+    loader = loader_getter()
+
+    assert loader({"a": 1, "b": 2}) == gauge(1, 2)
+    assert loader({"a": 1, "b": 2, "c": 3}) == gauge(1, 2, c=3)
+
+    data = {"a": 1, "c": 3}
+    raises_exc(
+        trail_select(
+            disable=NoRequiredFieldsLoadError({"b"}, data),
+            first=NoRequiredFieldsLoadError({"b"}, data),
+            all=AggregateLoadError(
+                f"while loading model {Gauge}",
+                [NoRequiredFieldsLoadError({"b"}, data)],
+            ),
+        ),
+        lambda: loader(data),
+    )
+
+
 def test_wild_extra_targets(debug_ctx, debug_trail):
     loader_getter = make_loader_getter(
         shape=shape(
@@ -1016,17 +1081,18 @@ def test_none_crown_at_dict_crown(debug_ctx, debug_trail, extra_policy, trail_se
 
     if extra_policy == ExtraCollect():
         assert loader({"a": 1, "b": 2, "c": 3}) == gauge(1, extra={"c": 3})
+        assert loader({"a": 1, "c": 3}) == gauge(1, extra={"c": 3})
 
     if extra_policy == ExtraForbid():
-        data = {"a": 1, "b": 2, "c": 3}
-        raises_exc(
-            trail_select(
-                disable=ExtraFieldsLoadError({"c"}, data),
-                first=ExtraFieldsLoadError({"c"}, data),
-                all=AggregateLoadError(f"while loading model {Gauge}", [ExtraFieldsLoadError({"c"}, data)]),
-            ),
-            lambda: loader(data),
-        )
+        for data in [{"a": 1, "b": 2, "c": 3}, {"a": 1, "c": 3}]:
+            raises_exc(
+                trail_select(
+                    disable=ExtraFieldsLoadError({"c"}, data),
+                    first=ExtraFieldsLoadError({"c"}, data),
+                    all=AggregateLoadError(f"while loading model {Gauge}", [ExtraFieldsLoadError({"c"}, data)]),
+                ),
+                lambda: loader(data),  # noqa: B023
+            )
 
 
 @pytest.mark.parametrize("extra_policy", [ExtraSkip(), ExtraForbid()])